@@ -1,11 +1,31 @@
 import os
 import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Set, Tuple, Union
+from typing import (Callable, Dict, FrozenSet, Iterable, Iterator, List,
+                    Optional, Set, Tuple, Union)
 
 import click
-import gitdb
-from git import InvalidGitRepositoryError, Repo
+from git import GitCommandError, Head, InvalidGitRepositoryError, Repo
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=4)
+def _discover_repo(cwd: str) -> Repo:
+    """Discover the repository containing the given directory, shared across GitUtil instances.
+    The CLI constructs GitUtil many times per run and each discovery walks the parent
+    directories looking for .git; Repo objects read state on demand, so reusing one between
+    read-only instances is safe.
+    Args:
+        cwd (str): the directory to start the discovery from.
+    """
+    return Repo(cwd, search_parent_directories=True)
 
 
 class GitUtil:
@@ -14,15 +34,282 @@ class GitUtil:
     def __init__(self, repo: Repo = None):
         if not repo:
             try:
-                self.repo = Repo(Path.cwd(), search_parent_directories=True)
+                self.repo = _discover_repo(str(Path.cwd()))
             except InvalidGitRepositoryError:
                 raise InvalidGitRepositoryError("Unable to find Repository from current working directory - aborting")
         else:
             self.repo = repo
 
+        # repeated read-only invocations in the same process should not take git's optional
+        # locks (e.g. the index lock status grabs by default).
+        self.repo.git.update_environment(GIT_OPTIONAL_LOCKS='0')
+        self._git_env = {**os.environ, 'GIT_OPTIONAL_LOCKS': '0'}
+
+        # resolved once so direct git invocations skip both GitPython's per-command environment
+        # bookkeeping and the repository re-discovery inside the subprocess.
+        self._git_dir = self.repo.git_dir
+        self._work_tree = self.repo.working_tree_dir
+
+        # diffing against the same revisions shells out to git and re-parses the full diff every time,
+        # so cache the parsed results keyed by the compared revisions.
+        self._diff_cache: Dict[Tuple[str, str], Dict[str, Set]] = {}
+        self._staged_diff_cache: Dict[str, Dict[str, Set]] = {}
+
+        # parsed git status output, recomputed once per top-level status query.
+        self._status_cache: Optional[Dict[str, Set]] = None
+
+        # merge bases against HEAD, computed once per compared revision.
+        self._merge_base_cache: Dict[str, str] = {}
+
+        # final status results, computed once per argument combination.
+        self._results_cache: Dict[Tuple, FrozenSet] = {}
+
+        # sha fingerprints of HEAD and of each compared base ref from the last query, used to
+        # drop the caches when the repo moves (a commit, a checkout or a fetch moving the base).
+        self._last_head: Optional[str] = None
+        self._ref_fingerprints: Dict[str, str] = {}
+
+        # GitPython walks refs and re-reads the repo config on every active_branch/remote access,
+        # so resolve them lazily once per instance. Assumes HEAD and the remote set are not
+        # mutated behind this instance's back.
+        self._active_branch_cache: Optional[Head] = None
+        self._active_branch_sha: Optional[str] = None
+        self._remote_name: Optional[str] = None
+
+        # libgit2 diffs in-process without spawning git - prefer it when the binding is installed.
+        self._pygit2_repo = None
+        if pygit2:
+            try:
+                self._pygit2_repo = pygit2.Repository(self.repo.working_dir)
+            except pygit2.GitError:
+                self._pygit2_repo = None
+
+    def _refresh_caches_if_needed(self, prev_ver: str) -> None:
+        """Invalidate all caches when HEAD or the compared base ref moved since the last query -
+        e.g. an external commit, checkout or fetch in a long-running process.
+        A fetch moves the base ref without touching HEAD, and _diff_cache is keyed by the base's
+        name rather than its sha, so both shas are part of the fingerprint. Runs once per
+        top-level status query as a single rev-parse subprocess, which costs a few milliseconds,
+        rather than re-resolving the refs through GitPython on every call.
+        Args:
+            prev_ver (str): The base branch against which the comparison is made.
+        """
+        remote, branch = self._handle_prev_ver(prev_ver)
+        base = f'{remote}/{branch}' if remote else branch
+        shas = subprocess.run(['git', '--git-dir', self._git_dir, '--work-tree', self._work_tree,
+                               'rev-parse', 'HEAD', base],
+                              capture_output=True, text=True, cwd=self._work_tree,
+                              env=self._git_env).stdout.splitlines()
+        head_sha = shas[0] if shas else ''
+        base_sha = shas[1] if len(shas) > 1 else ''
+        if head_sha != self._last_head or base_sha != self._ref_fingerprints.get(base, base_sha):
+            self._last_head = head_sha
+            self._ref_fingerprints = {}
+            self._diff_cache.clear()
+            self._staged_diff_cache.clear()
+            self._merge_base_cache.clear()
+            self._results_cache.clear()
+            self._status_cache = None
+            self._active_branch_cache = None
+            self._active_branch_sha = None
+
+        self._ref_fingerprints[base] = base_sha
+
+    def _active_branch(self) -> Head:
+        """Get the checked out branch, resolved once per instance."""
+        if self._active_branch_cache is None:
+            self._active_branch_cache = self.repo.active_branch
+
+        return self._active_branch_cache
+
+    def _active_commit_sha(self) -> str:
+        """Get the sha1 of the active branch tip, resolved once per instance."""
+        if self._active_branch_sha is None:
+            self._active_branch_sha = self._active_branch().commit.hexsha
+
+        return self._active_branch_sha
+
+    def _default_remote(self) -> str:
+        """Get the name of the default remote, resolved once per instance."""
+        if self._remote_name is None:
+            self._remote_name = str(self.repo.remote())
+
+        return self._remote_name
+
+    def _run_git_raw(self, *args: str) -> Iterator[str]:
+        """Run a git command directly and yield its NUL separated output tokens as they stream in,
+        without materializing the full output as a single string.
+        Args:
+            args (str): the git command and its arguments.
+        Yields:
+            str: the NUL separated output tokens.
+        Raises:
+            GitCommandError: when git exits with a non-zero status.
+        """
+        # run from the work tree root - when the inherited cwd is a repo subdirectory git
+        # resolves pathspecs relative to it, which would break path-limited diffs.
+        command = ['git', '--git-dir', self._git_dir, '--work-tree', self._work_tree, *args]
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   bufsize=1 << 20, cwd=self._work_tree, env=self._git_env)
+        remainder = b''
+        for chunk in iter(partial(process.stdout.read, 1 << 16), b''):  # type: ignore[union-attr]
+            *tokens, remainder = (remainder + chunk).split(b'\x00')
+            for token in tokens:
+                yield token.decode('utf-8')
+
+        if remainder:
+            yield remainder.decode('utf-8')
+
+        stderr = process.stderr.read().decode('utf-8')  # type: ignore[union-attr]
+        if process.wait() != 0:
+            raise GitCommandError(command, process.returncode, stderr)
+
+    def _raw_diff(self, remote: str, branch: str) -> Dict[str, Set]:
+        """Get the changes of the active branch against the given prev_ver from a single raw git diff,
+        cached per compared revisions.
+        Args:
+            remote (str): The remote the prev_ver belongs to, or None when diffing against a commit sha1.
+            branch (str): The branch (or commit sha1 when remote is None) to diff against.
+        Returns:
+            Dict: the changed files bucketed by change type - sets of path strings under 'M', 'A' and 'D',
+            sets of (old_path, new_path) string tuples under 'R' (100% score renames) and
+            'R_UNTRUE' (renames with a score lower than 100%). Paths stay plain strings internally -
+            they hash and compare cheaper than Path objects - and are only converted on return
+            to the caller.
+        """
+        base = f'{remote}/{branch}' if remote else branch
+        key = (base, self._active_commit_sha())
+        if key not in self._diff_cache:
+            # when prev_ver points at the tip of the active branch there is nothing to diff -
+            # common in CI runs executing on the target branch itself.
+            if self._base_commit_sha(remote, branch) == self._active_commit_sha():
+                self._diff_cache[key] = self._parse_raw_diff(())
+                return self._diff_cache[key]
+
+            changes = self._pygit2_raw_diff(base) if self._pygit2_repo else None
+            if changes is None:
+                # --raw skips patch generation entirely - only the change type and paths are needed here.
+                # diffing from the precomputed merge base spares git the ancestry walk a three-dot
+                # range would redo on every invocation.
+                changes = self._parse_raw_diff(
+                    self._run_git_raw('diff', '--raw', '-z', '-M', self._merge_base(base), str(self._active_branch())))
+
+            self._diff_cache[key] = changes
+
+        return self._diff_cache[key]
+
+    def _merge_base(self, base: str) -> str:
+        """Get the merge base of the given revision and the active branch, computed once per revision.
+        Args:
+            base (str): The revision to find the merge base with.
+        """
+        if base not in self._merge_base_cache:
+            self._merge_base_cache[base] = ''.join(
+                self._run_git_raw('merge-base', base, str(self._active_branch()))).strip()
+
+        return self._merge_base_cache[base]
+
+    def _base_commit_sha(self, remote: str, branch: str) -> Optional[str]:
+        """Get the sha1 the given prev_ver points at, or None when it cannot be resolved.
+        Args:
+            remote (str): The remote the prev_ver belongs to, or None when it is a commit sha1.
+            branch (str): The branch (or commit sha1 when remote is None).
+        """
+        if not remote:
+            return branch.lower()
+
+        try:
+            return self.repo.remote(name=remote).refs[branch].commit.hexsha
+        except IndexError:
+            return None
+
+    def _pygit2_raw_diff(self, base: str) -> Optional[Dict[str, Set]]:
+        """Compute the merge base diff against HEAD in-process with libgit2.
+        Iterates the raw deltas rather than the diff itself so no patch text is generated.
+        Args:
+            base (str): The revision to diff against.
+        Returns:
+            Dict: the changed files bucketed by change type (see _raw_diff), or None when
+            libgit2 cannot resolve the revisions (the caller then falls back to the git subprocess).
+        """
+        repo = self._pygit2_repo
+        if repo is None:
+            return None
+
+        try:
+            head_oid = repo.revparse_single('HEAD').peel(pygit2.Commit).id
+            merge_base = self._merge_base_cache.get(base)
+            if merge_base is None:
+                base_oid = repo.revparse_single(base).peel(pygit2.Commit).id
+                merge_base_oid = repo.merge_base(base_oid, head_oid)
+                if merge_base_oid is None:
+                    return None
+
+                merge_base = str(merge_base_oid)
+                self._merge_base_cache[base] = merge_base
+
+            diff = repo.diff(repo[merge_base].tree, repo[head_oid].tree)
+        except (KeyError, pygit2.GitError):
+            return None
+
+        # detect renames, matching git diff -M on the subprocess path.
+        diff.find_similar()
+
+        changes: Dict[str, Set] = {'M': set(), 'A': set(), 'D': set(), 'R': set(), 'R_UNTRUE': set()}
+        status_map = {pygit2.GIT_DELTA_MODIFIED: 'M', pygit2.GIT_DELTA_ADDED: 'A', pygit2.GIT_DELTA_DELETED: 'D'}
+        for delta in diff.deltas:
+            if delta.status == pygit2.GIT_DELTA_RENAMED:
+                rename = (delta.old_file.path, delta.new_file.path)
+                changes['R' if delta.similarity == 100 else 'R_UNTRUE'].add(rename)
+            elif delta.status in status_map:
+                changes[status_map[delta.status]].add(delta.new_file.path)
+
+        return changes
+
+    @staticmethod
+    def _parse_raw_diff(output: Iterable[str]) -> Dict[str, Set]:
+        """Parse the NUL separated output of git diff --raw -z into sets of paths per change type.
+        Args:
+            output (Iterable): the raw diff output tokens - a NUL separated stream of
+            ':mode mode sha sha STATUS' records each followed by one path (two for renames and copies).
+        Returns:
+            Dict: the changed files bucketed by change type (see _raw_diff).
+        """
+        changes: Dict[str, Set] = {'M': set(), 'A': set(), 'D': set(), 'R': set(), 'R_UNTRUE': set()}
+        tokens = iter(output)
+        for meta in tokens:
+            if not meta:
+                continue
+
+            status = meta.rsplit(' ', 1)[-1]
+            path = next(tokens)
+            if status[0] in ('R', 'C'):
+                rename = (path, next(tokens))
+                if status[0] == 'R':
+                    changes['R' if status == 'R100' else 'R_UNTRUE'].add(rename)
+            elif status in changes:
+                changes[status].add(path)
+
+        return changes
+
+    def _staged_raw_diff(self, base: str = 'HEAD') -> Dict[str, Set]:
+        """Get the staged changes (the index) against the given base from a single raw git diff,
+        cached per base revision.
+        Args:
+            base (str): The revision to diff the index against.
+        Returns:
+            Dict: the staged files bucketed by change type (see _raw_diff).
+        """
+        if base not in self._staged_diff_cache:
+            self._staged_diff_cache[base] = self._parse_raw_diff(
+                self._run_git_raw('diff', '--cached', '--raw', '-z', '-M', base))
+
+        return self._staged_diff_cache[base]
+
     def modified_files(self, prev_ver: str = 'master', committed_only: bool = False,
                        staged_only: bool = False, debug: bool = False, include_untracked: bool = False) -> Set[Path]:
         """Gets all the files that are recognized by git as modified against the prev_ver.
+        The result is computed once per argument combination and reused within the instance.
         Args:
             prev_ver (str): The base branch against which the comparison is made.
             committed_only (bool): Whether to return only committed files.
@@ -32,6 +319,24 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the modified files.
         """
+        self._refresh_caches_if_needed(prev_ver)
+        return {Path(file) for file in
+                self._modified_result(prev_ver, committed_only, staged_only, debug, include_untracked)}
+
+    def _modified_result(self, prev_ver: str = 'master', committed_only: bool = False, staged_only: bool = False,
+                         debug: bool = False, include_untracked: bool = False) -> FrozenSet[str]:
+        """Cached str-level result of modified_files, for internal set operations.
+        Callers are expected to have refreshed the caches for prev_ver already."""
+        key = ('modified', prev_ver, committed_only, staged_only, include_untracked)
+        if key not in self._results_cache:
+            self._results_cache[key] = frozenset(
+                self._modified_files(prev_ver, committed_only, staged_only, debug, include_untracked))
+
+        return self._results_cache[key]
+
+    def _modified_files(self, prev_ver: str, committed_only: bool,
+                        staged_only: bool, debug: bool, include_untracked: bool) -> Set[str]:
+        """modified_files implementation, without the result caching."""
         remote, branch = self._handle_prev_ver(prev_ver)
 
         # when checking branch against itself only return the last commit.
@@ -42,39 +347,22 @@ class GitUtil:
 
         # get all renamed files - some of these can be identified as modified by git,
         # but we want to identify them as renamed - so will remove them from the returned files.
-        renamed = {item[0] for item in self.renamed_files(prev_ver, committed_only, staged_only)}  # type: ignore[index]
+        renamed = {item[0] for item in self._renamed_result(prev_ver, committed_only, staged_only)}
 
-        # handle a case where a file is wrongly recognized as renamed (not 100% score) and
-        # is actually of modified status
-        untrue_rename_staged = self.handle_wrong_renamed_status(status='M', remote=remote, branch=branch,
-                                                                staged_only=True)
-        untrue_rename_committed = self.handle_wrong_renamed_status(status='M', remote=remote, branch=branch,
-                                                                   staged_only=False)
-
-        deleted = self.deleted_files(prev_ver, committed_only, staged_only)
+        deleted = self._deleted_result(prev_ver, committed_only, staged_only)
 
         committed = set()
 
         if not staged_only:
+            # handle a case where a file is wrongly recognized as renamed (not 100% score) and
+            # is actually of modified status
+            untrue_rename_committed = self.handle_wrong_renamed_status(status='M', remote=remote, branch=branch,
+                                                                       staged_only=False)
+
             # get all committed files identified as modified which are changed from prev_ver.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {Path(os.path.join(item.a_path)) for item
-                             in self.repo.remote(name=remote).refs[branch].commit.diff(
-                    self.repo.active_branch).iter_change_type('M')}.union(untrue_rename_committed)
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {Path(os.path.join(item.a_path)) for item in self.repo.commit(rev=prev_ver).diff(
-                    self.repo.active_branch).iter_change_type('M')}.union(untrue_rename_committed)
-
-            # identify all files that were touched on this branch regardless of status
-            # intersect these with all the committed files to identify the committed modified files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
-            committed = committed.intersection(all_branch_changed_files)
-
-        # remove the renamed and deleted files from the committed
-        committed = committed - renamed - deleted
+            # remove the renamed and deleted files from the committed
+            committed = self._raw_diff(remote, branch)['M'].union(untrue_rename_committed) - renamed - deleted
 
         if committed_only:
             self.debug_print(debug=debug, status='Modified', staged=set(), committed=committed)
@@ -83,33 +371,32 @@ class GitUtil:
         untracked = set()  # type: Set
         if include_untracked:
             # get all untracked modified files
-            untracked = self._get_untracked_files('M')
+            untracked = self._porcelain_status()['M']
+
+        # handle a case where a file is wrongly recognized as renamed (not 100% score) and
+        # is actually of modified status
+        untrue_rename_staged = self.handle_wrong_renamed_status(status='M', remote=remote, branch=branch,
+                                                                staged_only=True)
 
         # get all the files that are staged on the branch and identified as modified.
-        staged = {Path(os.path.join(item.a_path)) for item
-                  in self.repo.head.commit.diff().iter_change_type('M')}.union(untracked).union(untrue_rename_staged)
+        staged = self._staged_raw_diff()['M'].union(untracked).union(untrue_rename_staged)
+
+        if staged_only:
+            # the staged-only fast path subtracts only locally known renames and deletions,
+            # so the base-ref diff is never computed.
+            staged = staged - renamed - deleted
+            self.debug_print(debug=debug, status='Modified', staged=staged, committed=set())
+            return staged
 
         # If a file is Added in regards to prev_ver
         # and is then modified locally after being committed - it is identified as modified
         # but we want to identify the file as Added (its actual status against prev_ver) -
         # so will remove it from the staged modified files.
         # also remove the deleted and renamed files as well.
-        if remote:
-            committed_added = {Path(os.path.join(item.a_path)) for item in
-                               self.repo.remote(name=remote).refs[branch].commit.
-                               diff(self.repo.active_branch).iter_change_type('A')}
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed_added = {Path(os.path.join(item.a_path)) for item in
-                               self.repo.commit(rev=prev_ver).diff(self.repo.active_branch).iter_change_type('A')}
+        committed_added = self._raw_diff(remote, branch)['A']
 
         staged = staged - committed_added - renamed - deleted
 
-        if staged_only:
-            self.debug_print(debug=debug, status='Modified', staged=staged, committed=set())
-            return staged
-
         self.debug_print(debug=debug, status='Modified', staged=staged, committed=committed)
 
         return staged.union(committed)
@@ -117,6 +404,7 @@ class GitUtil:
     def added_files(self, prev_ver: str = 'master', committed_only: bool = False,
                     staged_only: bool = False, debug: bool = False, include_untracked: bool = False) -> Set[Path]:
         """Gets all the files that are recognized by git as added against the prev_ver.
+        The result is computed once per argument combination and reused within the instance.
         Args:
             prev_ver (str): The base branch against which the comparison is made.
             committed_only (bool): Whether to return only committed files.
@@ -126,6 +414,24 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the added files.
         """
+        self._refresh_caches_if_needed(prev_ver)
+        return {Path(file) for file in
+                self._added_result(prev_ver, committed_only, staged_only, debug, include_untracked)}
+
+    def _added_result(self, prev_ver: str = 'master', committed_only: bool = False, staged_only: bool = False,
+                      debug: bool = False, include_untracked: bool = False) -> FrozenSet[str]:
+        """Cached str-level result of added_files, for internal set operations.
+        Callers are expected to have refreshed the caches for prev_ver already."""
+        key = ('added', prev_ver, committed_only, staged_only, include_untracked)
+        if key not in self._results_cache:
+            self._results_cache[key] = frozenset(
+                self._added_files(prev_ver, committed_only, staged_only, debug, include_untracked))
+
+        return self._results_cache[key]
+
+    def _added_files(self, prev_ver: str, committed_only: bool,
+                     staged_only: bool, debug: bool, include_untracked: bool) -> Set[str]:
+        """added_files implementation, without the result caching."""
         remote, branch = self._handle_prev_ver(prev_ver)
 
         # when checking branch against itself only return the last commit.
@@ -134,34 +440,20 @@ class GitUtil:
             self.debug_print(debug=debug, status='Added', staged=set(), committed=last_commit)
             return last_commit
 
-        deleted = self.deleted_files(prev_ver, committed_only, staged_only)
-
-        # handle a case where a file is wrongly recognized as renamed (not 100% score) and is actually of added status
-        untrue_rename_staged = self.handle_wrong_renamed_status(status='A', remote=remote, branch=branch,
-                                                                staged_only=True)
-        untrue_rename_committed = self.handle_wrong_renamed_status(status='A', remote=remote, branch=branch,
-                                                                   staged_only=False)
-
-        # get all committed files identified as added which are changed from prev_ver.
-        # this can result in extra files identified which were not touched on this branch.
-        if remote:
-            committed = {Path(os.path.join(item.a_path)) for item
-                         in self.repo.remote(name=remote).refs[branch].commit.diff(
-                self.repo.active_branch).iter_change_type('A')}.union(untrue_rename_committed)
+        deleted = self._deleted_result(prev_ver, committed_only, staged_only)
 
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed = {Path(os.path.join(item.a_path)) for item
-                         in self.repo.commit(rev=prev_ver).diff(
-                self.repo.active_branch).iter_change_type('A')}.union(untrue_rename_committed)
+        committed = set()
 
-        # identify all files that were touched on this branch regardless of status
-        # intersect these with all the committed files to identify the committed added files.
-        all_branch_changed_files = self._get_all_changed_files(prev_ver)
-        committed = committed.intersection(all_branch_changed_files)
+        if not staged_only:
+            # handle a case where a file is wrongly recognized as renamed (not 100% score)
+            # and is actually of added status
+            untrue_rename_committed = self.handle_wrong_renamed_status(status='A', remote=remote, branch=branch,
+                                                                       staged_only=False)
 
-        # remove deleted files
-        committed = committed - deleted
+            # get all committed files identified as added which are changed from prev_ver.
+            # this can result in extra files identified which were not touched on this branch.
+            # remove deleted files
+            committed = self._raw_diff(remote, branch)['A'].union(untrue_rename_committed) - deleted
 
         if committed_only:
             self.debug_print(debug=debug, status='Added', staged=set(), committed=committed)
@@ -171,22 +463,24 @@ class GitUtil:
         untracked_modified = set()  # type: Set
         if include_untracked:
             # get all untracked added files
-            untracked_added = self._get_untracked_files('A')
+            untracked_added = self._porcelain_status()['A']
 
             # get all untracked modified files
-            untracked_modified = self._get_untracked_files('M')
+            untracked_modified = self._porcelain_status()['M']
+
+        # handle a case where a file is wrongly recognized as renamed (not 100% score) and is actually of added status
+        untrue_rename_staged = self.handle_wrong_renamed_status(status='A', remote=remote, branch=branch,
+                                                                staged_only=True)
 
         # get all the files that are staged on the branch and identified as added.
-        staged = {Path(os.path.join(item.a_path)) for item in
-                  self.repo.head.commit.diff().iter_change_type('A')}.union(untrue_rename_staged)
+        staged = self._staged_raw_diff()['A'].union(untrue_rename_staged)
 
         # If a file is Added in regards to prev_ver
         # and is then modified locally after being committed - it is identified as modified
         # but we want to identify the file as Added (its actual status against prev_ver) -
         # so will added it from the staged added files.
         # same goes to untracked files - can be identified as modified but are actually added against prev_ver
-        committed_added_locally_modified = {Path(os.path.join(item.a_path)) for item in
-                                            self.repo.head.commit.diff().iter_change_type('M')}.intersection(committed)
+        committed_added_locally_modified = self._staged_raw_diff()['M'].intersection(committed)
         untracked = untracked_added.union(untracked_modified.intersection(committed))
 
         staged = staged.union(committed_added_locally_modified).union(untracked)
@@ -205,6 +499,7 @@ class GitUtil:
     def deleted_files(self, prev_ver: str = 'master', committed_only: bool = False,
                       staged_only: bool = False, include_untracked: bool = False) -> Set[Path]:
         """Gets all the files that are recognized by git as deleted against the prev_ver.
+        The result is computed once per argument combination and reused within the instance.
         Args:
             prev_ver (str): The base branch against which the comparison is made.
             committed_only (bool): Whether to return only committed files.
@@ -213,6 +508,24 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the deleted files.
         """
+        self._refresh_caches_if_needed(prev_ver)
+        return {Path(file) for file in
+                self._deleted_result(prev_ver, committed_only, staged_only, include_untracked)}
+
+    def _deleted_result(self, prev_ver: str = 'master', committed_only: bool = False, staged_only: bool = False,
+                        include_untracked: bool = False) -> FrozenSet[str]:
+        """Cached str-level result of deleted_files, for internal set operations.
+        Callers are expected to have refreshed the caches for prev_ver already."""
+        key = ('deleted', prev_ver, committed_only, staged_only, include_untracked)
+        if key not in self._results_cache:
+            self._results_cache[key] = frozenset(
+                self._deleted_files(prev_ver, committed_only, staged_only, include_untracked))
+
+        return self._results_cache[key]
+
+    def _deleted_files(self, prev_ver: str, committed_only: bool,
+                       staged_only: bool, include_untracked: bool) -> Set[str]:
+        """deleted_files implementation, without the result caching."""
         remote, branch = self._handle_prev_ver(prev_ver)
 
         # when checking branch against itself only return the last commit.
@@ -225,21 +538,7 @@ class GitUtil:
         if not staged_only:
             # get all committed files identified as added which are changed from prev_ver.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {Path(os.path.join(item.a_path)) for item
-                             in self.repo.remote(name=remote).refs[branch].commit.diff(
-                    self.repo.active_branch).iter_change_type('D')}
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {Path(os.path.join(item.a_path)) for item
-                             in self.repo.commit(rev=prev_ver).diff(
-                    self.repo.active_branch).iter_change_type('D')}
-
-            # identify all files that were touched on this branch regardless of status
-            # intersect these with all the committed files to identify the committed added files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
-            committed = committed.intersection(all_branch_changed_files)
+            committed = set(self._raw_diff(remote, branch)['D'])
 
         if committed_only:
             return committed
@@ -247,11 +546,10 @@ class GitUtil:
         untracked = set()  # type: Set
         if include_untracked:
             # get all untracked deleted files
-            untracked = self._get_untracked_files('D')
+            untracked = self._porcelain_status()['D']
 
         # get all the files that are staged on the branch and identified as added.
-        staged = {Path(os.path.join(item.a_path)) for item in
-                  self.repo.head.commit.diff().iter_change_type('D')}.union(untracked)
+        staged = self._staged_raw_diff()['D'].union(untracked)
 
         if staged_only:
             return staged
@@ -263,6 +561,7 @@ class GitUtil:
                       include_untracked: bool = False,
                       get_only_current_file_names: bool = False) -> Union[Set[Tuple[Path, Path]], Set[Path]]:
         """Gets all the files that are recognized by git as renamed against the prev_ver.
+        The result is computed once per argument combination and reused within the instance.
         Args:
             prev_ver (str): The base branch against which the comparison is made.
             committed_only (bool): Whether to return only committed files.
@@ -274,6 +573,27 @@ class GitUtil:
             Set: A set of Tuples of Paths to the renamed files -
             first element being the old file path and the second is the new.
         """
+        self._refresh_caches_if_needed(prev_ver)
+        renamed = self._renamed_result(prev_ver, committed_only, staged_only, debug, include_untracked)
+        if get_only_current_file_names:
+            return {Path(file[1]) for file in renamed}
+
+        return {(Path(old_path), Path(new_path)) for old_path, new_path in renamed}
+
+    def _renamed_result(self, prev_ver: str = 'master', committed_only: bool = False, staged_only: bool = False,
+                        debug: bool = False, include_untracked: bool = False) -> FrozenSet[Tuple[str, str]]:
+        """Cached str-level result of renamed_files, for internal set operations.
+        Callers are expected to have refreshed the caches for prev_ver already."""
+        key = ('renamed', prev_ver, committed_only, staged_only, include_untracked)
+        if key not in self._results_cache:
+            self._results_cache[key] = frozenset(
+                self._renamed_files(prev_ver, committed_only, staged_only, debug, include_untracked))
+
+        return self._results_cache[key]
+
+    def _renamed_files(self, prev_ver: str, committed_only: bool,
+                       staged_only: bool, debug: bool, include_untracked: bool) -> Set[Tuple[str, str]]:
+        """renamed_files implementation, without the result caching."""
         remote, branch = self._handle_prev_ver(prev_ver)
 
         # when checking branch against itself only return the last commit.
@@ -282,108 +602,81 @@ class GitUtil:
             self.debug_print(debug=debug, status='Renamed', staged=set(), committed=last_commit)
             return last_commit
 
-        deleted = self.deleted_files(prev_ver, committed_only, staged_only)
         committed = set()
 
         if not staged_only:
+            deleted = self._deleted_result(prev_ver, committed_only, staged_only)
+
             # get all committed files identified as renamed which are changed from prev_ver and are with 100% score.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {(Path(item.a_path), Path(item.b_path)) for item
-                             in self.repo.remote(name=remote).refs[branch].commit.diff(
-                    self.repo.active_branch).iter_change_type('R') if item.score == 100}
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {(Path(item.a_path), Path(item.b_path)) for item
-                             in self.repo.commit(rev=prev_ver).diff(
-                    self.repo.active_branch).iter_change_type('R') if item.score == 100}
-
-            # identify all files that were touched on this branch regardless of status
-            # intersect these with all the committed files to identify the committed added files.
-            all_branch_changed_files = self._get_all_changed_files(prev_ver)
-            committed = {tuple_item for tuple_item in committed
-                         if (tuple_item[1] in all_branch_changed_files and tuple_item[1] not in deleted)}
+            committed = {tuple_item for tuple_item in self._raw_diff(remote, branch)['R']
+                         if tuple_item[1] not in deleted}
 
         if committed_only:
             self.debug_print(debug=debug, status='Renamed', staged=set(), committed=committed)
-            if get_only_current_file_names:
-                committed_only_new = {file[1] for file in committed}
-                return committed_only_new
-
             return committed
 
         untracked = set()  # type:Set
         if include_untracked:
             # get all untracked renamed files
-            untracked = self._get_untracked_files('R')
+            untracked = self._porcelain_status()['R']
 
         # get all the files that are staged on the branch and identified as renamed and are with 100% score.
-        staged = {(Path(item.a_path), Path(item.b_path)) for item
-                  in self.repo.head.commit.diff().iter_change_type('R') if item.score == 100}.union(untracked)
+        staged = self._staged_raw_diff()['R'].union(untracked)
 
         if staged_only:
             self.debug_print(debug=debug, status='Renamed', staged=staged, committed=set())
-            if get_only_current_file_names:
-                staged_only_new = {file[1] for file in staged}
-                return staged_only_new
-
             return staged
 
         self.debug_print(debug=debug, status='Renamed', staged=staged, committed=committed)
 
-        all_renamed_files = staged.union(committed)
-        if get_only_current_file_names:
-            all_renamed_files_only_new = {file[1] for file in all_renamed_files}
-            return all_renamed_files_only_new
-
-        return all_renamed_files
+        return staged.union(committed)
 
-    def _get_untracked_files(self, requested_status: str) -> set:
-        """return all untracked files of the given requested status.
-        Args:
-            requested_status (str): M, A, R, D - the git status to return
+    def _porcelain_status(self) -> Dict[str, Set]:
+        """Get the local (staged and untracked) changes bucketed by status, from a single git status run.
         Returns:
-            Set: of path strings which include the untracked files of a certain status.
+            Dict: sets of path strings of the locally changed files under 'M', 'A' (including untracked)
+            and 'D', and a set of (old_path, new_path) string tuples under 'R'.
         """
-        git_status = self.repo.git.status('--short', '-u').split('\n')
+        if self._status_cache is None:
+            self._status_cache = self._parse_porcelain_status(
+                self._run_git_raw('status', '--porcelain', '-z', '-u'))
 
-        # in case there are no local changes - return
-        if git_status == ['']:
-            return set()
+        return self._status_cache
 
-        extracted_paths = set()
-        for line in git_status:
-            line = line.strip()
-            file_status = line.split()[0].upper() if not line.startswith('?') else 'A'
-            if file_status.startswith(requested_status):
-                if requested_status == 'R':
-                    if file_status == 'R100':
-                        extracted_paths.add((Path(line.split()[-2]), Path(line.split()[-1])))
-                else:
-                    extracted_paths.add(Path(line.split()[-1]))  # type: ignore
-
-        return extracted_paths
-
-    def _get_all_changed_files(self, prev_ver: str) -> Set[Path]:
-        """Get all the files changed in the current branch without status distinction.
+    @staticmethod
+    def _parse_porcelain_status(output: Iterable[str]) -> Dict[str, Set]:
+        """Parse the NUL separated output of git status --porcelain -z into sets of paths per status.
         Args:
-            prev_ver (str): The base branch against which the comparison is made.
+            output (Iterable): the porcelain status output tokens - a NUL separated stream of
+            'XY path' records, where rename and copy records are followed by an extra NUL
+            separated original path.
         Returns:
-            Set: of Paths to files changed in the current branch.
+            Dict: the locally changed files bucketed by status (see _porcelain_status).
         """
-        remote, branch = self._handle_prev_ver(prev_ver)
-
-        if remote:
-            return {Path(os.path.join(item)) for item
-                    in self.repo.git.diff('--name-only',
-                                          f'{remote}/{branch}...{self.repo.active_branch}').split('\n')}
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            return {Path(os.path.join(item)) for item
-                    in self.repo.git.diff('--name-only',
-                                          f'{prev_ver}...{self.repo.active_branch}').split('\n')}
+        statuses: Dict[str, Set] = {'M': set(), 'A': set(), 'D': set(), 'R': set()}
+        tokens = iter(output)
+        for record in tokens:
+            if not record:
+                continue
+
+            # fixed layout record - 2 status letters, a space and the path (may contain whitespace).
+            xy = record[:2]
+            path = record[3:]
+            status = xy[0] if xy[0] != ' ' else xy[1]
+            if status == '?':
+                status = 'A'
+
+            if status in ('R', 'C'):
+                # copy records (status.renames=copies) carry the same extra origin path token
+                # as renames - consume it either way so the stream stays aligned.
+                original_path = next(tokens)
+                if status == 'R':
+                    statuses['R'].add((original_path, path))
+            elif status in statuses:
+                statuses[status].add(path)
+
+        return statuses
 
     def _only_last_commit(self, prev_ver: str, requested_status: str) -> Set:
         """Get all the files that were changed in the last commit of a given type when checking a branch against itself.
@@ -391,7 +684,7 @@ class GitUtil:
             prev_ver (str): The base branch against which the comparison is made.
             requested_status (str): M, A, R, D - the git status to return
         Returns:
-            Set: of Paths to files changed in the the last commit or an empty set if not
+            Set: of paths to files changed in the the last commit or an empty set if not
             running on master against master.
         """
         # when checking branch against itself only return the last commit.
@@ -399,17 +692,15 @@ class GitUtil:
             return set()
 
         try:
-            if requested_status != 'R':
-                return {Path(os.path.join(item.a_path)) for item in
-                        self.repo.commit('HEAD~1').diff().iter_change_type(requested_status) if item.score == 100}
-            else:
-                return {(Path(item.a_path), Path(item.b_path)) for item in
-                        self.repo.commit('HEAD~1').diff().iter_change_type(requested_status)}
-        except gitdb.exc.BadName:
+            changes = self._staged_raw_diff('HEAD~1')
+        except GitCommandError:
             # in case no last commit exists - just pass
-            pass
+            return set()
+
+        if requested_status == 'R':
+            return set(changes['R'])
 
-        return set()
+        return set(changes[requested_status])
 
     def check_if_remote_exists(self, remote):
         if '/' in remote:
@@ -425,17 +716,17 @@ class GitUtil:
 
         if '/' in prev_ver:
             remote = prev_ver.split('/')[0]
-            remote = remote if self.check_if_remote_exists(remote) else str(self.repo.remote())
+            remote = remote if self.check_if_remote_exists(remote) else self._default_remote()
             branch = prev_ver.split('/')[1]
 
         else:
-            remote = str(self.repo.remote())
+            remote = self._default_remote()
             branch = prev_ver
 
         return remote, branch
 
     def get_current_working_branch(self) -> str:
-        return str(self.repo.active_branch)
+        return str(self._active_branch())
 
     def git_path(self) -> str:
         git_path = self.repo.git.rev_parse('--show-toplevel')
@@ -450,7 +741,7 @@ class GitUtil:
             click.echo(committed)
             click.echo('\n')
 
-    def handle_wrong_renamed_status(self, status: str, remote: str, branch: str, staged_only: bool) -> Set[Path]:
+    def handle_wrong_renamed_status(self, status: str, remote: str, branch: str, staged_only: bool) -> Set[str]:
         """Get all the files that are recognized as non-100% rename in a given file status.
         Args:
             status (str): the requested file status
@@ -458,22 +749,14 @@ class GitUtil:
             branch (str): the used git branch
             staged_only (bool): whether to bring only staged files
         Returns:
-            Set: of Paths to non 100% renamed files which are of a given status.
+            Set: of paths to non 100% renamed files which are of a given status.
         """
         if staged_only:
-            return {Path(item.b_path) for item
-                    in self.repo.head.commit.diff().iter_change_type('R') if item.score < 100 and
-                    self._check_file_status(file_path=str(item.b_path), remote=remote, branch=branch) == status}
-
-        if remote:
-            return {Path(item.b_path) for item in self.repo.remote(name=remote).refs[branch].commit.diff(
-                self.repo.active_branch).iter_change_type('R') if item.score < 100 and
-                self._check_file_status(file_path=str(item.b_path), remote=remote, branch=branch) == status}
+            return {new_path for _, new_path in self._staged_raw_diff()['R_UNTRUE']
+                    if self._check_file_status(file_path=new_path, remote=remote, branch=branch) == status}
 
-        # if remote does not exist we are checking against the commit sha1
-        return {Path(item.b_path) for item in self.repo.commit(rev=branch).diff(
-            self.repo.active_branch).iter_change_type('R') if item.score < 100 and
-            self._check_file_status(file_path=str(item.b_path), remote=remote, branch=branch) == status}
+        return {new_path for _, new_path in self._raw_diff(remote, branch)['R_UNTRUE']
+                if self._check_file_status(file_path=new_path, remote=remote, branch=branch) == status}
 
     def _check_file_status(self, file_path: str, remote: str, branch: str) -> str:
         """Get the git status of a given file path
@@ -484,21 +767,18 @@ class GitUtil:
         Returns:
             str: the git status of the file (M, A, R, D).
         """
-        if remote:
-            diff_line = self.repo.git.diff('--name-status',
-                                           f'{remote}/{branch}...{self.repo.active_branch}',
-                                           '--', file_path)
+        base = f'{remote}/{branch}' if remote else branch
 
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            diff_line = self.repo.git.diff('--name-status',
-                                           f'{branch}...{self.repo.active_branch}',
-                                           '--', file_path)
+        # the diff is limited to a single path, so rename detection cannot pair it with its
+        # counterpart anyway - disable it to skip the similarity scoring pass.
+        tokens = list(self._run_git_raw('diff', '--name-status', '--no-renames', '-z',
+                                        self._merge_base(base), str(self._active_branch()),
+                                        '--', file_path))
 
-        if not diff_line:
+        if not tokens or not tokens[0]:
             return ''
 
-        return diff_line.split()[0].upper() if not diff_line.startswith('?') else 'A'
+        return tokens[0].upper() if not tokens[0].startswith('?') else 'A'
 
     def get_local_remote_file_content(self, git_file_path: str) -> str:
         """Get local file content from remote branch. For example get origin/master:README.md
@@ -532,6 +812,53 @@ class GitUtil:
                 raise exc
         return f'{remote_name}/{tag}:{relative_file_path}'
 
+    def all_statuses(self, prev_ver: str = 'master', committed_only: bool = False,
+                     staged_only: bool = False, debug: bool = False,
+                     include_untracked: bool = False) -> Dict[str, Set]:
+        """Get the modified, added, deleted and renamed files in a single query.
+
+        The underlying git reads (base-ref diff, staged diff and porcelain status) are
+        independent and I/O bound, so they are warmed concurrently before the per-status
+        results are assembled from the caches - the wall time is roughly that of the slowest
+        read instead of their sum.
+        Args:
+            prev_ver (str): The base branch against which the comparison is made.
+            committed_only (bool): Whether to return only committed files.
+            staged_only (bool): Whether to return only staged files.
+            debug (bool): Whether to print the debug logs.
+            include_untracked (bool): Whether to include untracked files.
+        Returns:
+            Dict: sets of Paths under 'modified', 'added' and 'deleted', and a set of
+            (old_path, new_path) tuples under 'renamed'.
+        """
+        self._refresh_caches_if_needed(prev_ver)
+        remote, branch = self._handle_prev_ver(prev_ver)
+
+        warmers: List[Callable[[], Dict[str, Set]]] = []
+        if not staged_only:
+            warmers.append(partial(self._raw_diff, remote, branch))
+        if not committed_only:
+            warmers.append(self._staged_raw_diff)
+            if include_untracked:
+                warmers.append(self._porcelain_status)
+
+        if len(warmers) > 1:
+            with ThreadPoolExecutor(max_workers=len(warmers)) as executor:
+                for future in [executor.submit(warmer) for warmer in warmers]:
+                    future.result()
+
+        # assemble from the str-level results directly - the single refresh above covers them.
+        return {
+            'modified': {Path(file) for file in
+                         self._modified_result(prev_ver, committed_only, staged_only, debug, include_untracked)},
+            'added': {Path(file) for file in
+                      self._added_result(prev_ver, committed_only, staged_only, debug, include_untracked)},
+            'deleted': {Path(file) for file in
+                        self._deleted_result(prev_ver, committed_only, staged_only, include_untracked)},
+            'renamed': {(Path(old_path), Path(new_path)) for old_path, new_path in
+                        self._renamed_result(prev_ver, committed_only, staged_only, debug, include_untracked)},
+        }
+
     def get_all_changed_files(self, prev_ver: str = 'master', committed_only: bool = False,
                               staged_only: bool = False, debug: bool = False,
                               include_untracked: bool = False) -> Set[Path]:
@@ -546,14 +873,8 @@ class GitUtil:
         Returns:
             Set. A set of all the changed files in the given branch when comparing to prev_ver
         """
-        modified_files: Set[Path] = self.modified_files(prev_ver=prev_ver, committed_only=committed_only,
-                                                        staged_only=staged_only, debug=debug,
-                                                        include_untracked=include_untracked)
-        added_files: Set[Path] = self.added_files(prev_ver=prev_ver, committed_only=committed_only,
-                                                  staged_only=staged_only, debug=debug,
-                                                  include_untracked=include_untracked)
-        renamed_files: Set[Path] = self.renamed_files(prev_ver=prev_ver, committed_only=committed_only,  # type: ignore[assignment]
-                                                      staged_only=staged_only, debug=debug,
-                                                      include_untracked=include_untracked,
-                                                      get_only_current_file_names=True)
-        return modified_files.union(added_files).union(renamed_files)
+        statuses = self.all_statuses(prev_ver=prev_ver, committed_only=committed_only,
+                                     staged_only=staged_only, debug=debug,
+                                     include_untracked=include_untracked)
+        renamed_files = {new_path for _, new_path in statuses['renamed']}
+        return statuses['modified'].union(statuses['added']).union(renamed_files)
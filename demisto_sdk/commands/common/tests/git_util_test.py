@@ -0,0 +1,239 @@
+import subprocess
+
+import pytest
+from git import GitCommandError, Repo
+
+from demisto_sdk.commands.common.git_util import GitUtil
+
+
+class TestParseRawDiff:
+    data_test_single_status = [
+        (':100644 100644 1234567 89abcde M', 'pack/file.yml', 'M'),
+        (':000000 100644 0000000 89abcde A', 'pack/new file.yml', 'A'),
+        (':100644 000000 1234567 0000000 D', 'pack/old.yml', 'D'),
+    ]
+
+    @pytest.mark.parametrize('meta, path, expected_status', data_test_single_status)
+    def test_single_status(self, meta, path, expected_status):
+        """
+        Given:
+            a raw diff record of a modified, added or deleted file (including a path with spaces)
+        When:
+            parsing the NUL separated token stream
+        Then:
+            verify the path lands in the matching bucket and the others stay empty
+        """
+        changes = GitUtil._parse_raw_diff([meta, path])
+
+        assert changes[expected_status] == {path}
+        assert all(not files for status, files in changes.items() if status != expected_status)
+
+    def test_renames_are_split_by_score(self):
+        """
+        Given:
+            a 100% score rename record and a lower score rename record
+        When:
+            parsing the NUL separated token stream
+        Then:
+            verify the 100% rename is bucketed under R and the other under R_UNTRUE,
+            both as (old_path, new_path) tuples
+        """
+        changes = GitUtil._parse_raw_diff([
+            ':100644 100644 1234567 89abcde R100', 'old.yml', 'new.yml',
+            ':100644 100644 1234567 fedcba9 R075', 'was.yml', 'is.yml',
+        ])
+
+        assert changes['R'] == {('old.yml', 'new.yml')}
+        assert changes['R_UNTRUE'] == {('was.yml', 'is.yml')}
+
+    def test_copy_record_keeps_stream_aligned(self):
+        """
+        Given:
+            a copy record (two path tokens) followed by a modified record
+        When:
+            parsing the NUL separated token stream
+        Then:
+            verify both copy paths are consumed so the following record is parsed correctly
+        """
+        changes = GitUtil._parse_raw_diff([
+            ':100644 100644 1234567 1234567 C090', 'source.yml', 'copy.yml',
+            ':100644 100644 1234567 89abcde M', 'changed.yml',
+        ])
+
+        assert changes['M'] == {'changed.yml'}
+        assert not changes['R'] and not changes['R_UNTRUE']
+
+    def test_empty_output(self):
+        """
+        Given:
+            an empty diff output
+        When:
+            parsing the NUL separated token stream
+        Then:
+            verify all buckets exist and are empty
+        """
+        changes = GitUtil._parse_raw_diff(())
+
+        assert set(changes) == {'M', 'A', 'D', 'R', 'R_UNTRUE'}
+        assert all(not files for files in changes.values())
+
+
+class TestParsePorcelainStatus:
+    data_test_single_status = [
+        (' M pack/file.yml', 'M'),
+        ('M  pack/staged.yml', 'M'),
+        ('?? pack/new file.yml', 'A'),
+        ('A  pack/added.yml', 'A'),
+        (' D pack/deleted.yml', 'D'),
+    ]
+
+    @pytest.mark.parametrize('record, expected_status', data_test_single_status)
+    def test_single_status(self, record, expected_status):
+        """
+        Given:
+            a porcelain status record - staged, unstaged or untracked (including a path with spaces)
+        When:
+            parsing the NUL separated token stream
+        Then:
+            verify the path lands in the matching bucket, with untracked files treated as added
+        """
+        statuses = GitUtil._parse_porcelain_status([record])
+
+        assert statuses[expected_status] == {record[3:]}
+
+    def test_rename_consumes_original_path(self):
+        """
+        Given:
+            a rename record followed by its extra original path token and a modified record
+        When:
+            parsing the NUL separated token stream
+        Then:
+            verify the rename is returned as an (old_path, new_path) tuple and the
+            following record is parsed correctly
+        """
+        statuses = GitUtil._parse_porcelain_status([
+            'R  new.yml', 'old.yml',
+            ' M changed.yml',
+        ])
+
+        assert statuses['R'] == {('old.yml', 'new.yml')}
+        assert statuses['M'] == {'changed.yml'}
+
+    def test_copy_record_keeps_stream_aligned(self):
+        """
+        Given:
+            a copy record (emitted with status.renames=copies) followed by its extra
+            original path token and a modified record
+        When:
+            parsing the NUL separated token stream
+        Then:
+            verify the original path token is consumed so the following record is
+            parsed correctly and the copy itself is not bucketed
+        """
+        statuses = GitUtil._parse_porcelain_status([
+            'C  copy.yml', 'source.yml',
+            ' M changed.yml',
+        ])
+
+        assert statuses['M'] == {'changed.yml'}
+        assert not statuses['R']
+        assert 'source.yml' not in statuses['A']
+
+
+@pytest.fixture
+def scratch_git_util(tmp_path):
+    """A GitUtil over a scratch repo: a master base commit and a feature branch with a
+    modified, an added, a deleted, a fully renamed and a partially renamed file."""
+    def git(*args):
+        subprocess.run(['git', *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git('init', '-q')
+    git('config', 'user.email', 'test@test.com')
+    git('config', 'user.name', 'test')
+    (tmp_path / 'mod.txt').write_text('original\n' * 30)
+    (tmp_path / 'del.txt').write_text('to delete\n')
+    (tmp_path / 'ren.txt').write_text('renamed content\n' * 30)
+    (tmp_path / 'partial.txt').write_text('line\n' * 40)
+    git('add', '-A')
+    git('commit', '-q', '-m', 'base')
+    git('branch', '-M', 'master')
+    git('checkout', '-q', '-b', 'feature')
+    (tmp_path / 'mod.txt').write_text('original\n' * 29 + 'changed\n')
+    (tmp_path / 'added.txt').write_text('brand new\n')
+    (tmp_path / 'del.txt').unlink()
+    (tmp_path / 'ren.txt').rename(tmp_path / 'ren_new.txt')
+    (tmp_path / 'partial.txt').rename(tmp_path / 'partial_new.txt')
+    (tmp_path / 'partial_new.txt').write_text('line\n' * 30 + 'other\n' * 10)
+    git('add', '-A')
+    git('commit', '-q', '-m', 'branch work')
+    return GitUtil(repo=Repo(str(tmp_path)))
+
+
+def test_run_git_raw_yields_nul_separated_tokens(scratch_git_util):
+    """
+    Given:
+        a git command with NUL separated output
+    When:
+        streaming it through _run_git_raw
+    Then:
+        verify the output is yielded token by token
+    """
+    tokens = list(scratch_git_util._run_git_raw('ls-tree', '--name-only', '-z', 'master'))
+
+    assert tokens == ['del.txt', 'mod.txt', 'partial.txt', 'ren.txt']
+
+
+def test_run_git_raw_raises_on_failure(scratch_git_util):
+    """
+    Given:
+        a git command that fails
+    When:
+        streaming it through _run_git_raw
+    Then:
+        verify a GitCommandError carrying git's stderr diagnostics is raised
+    """
+    with pytest.raises(GitCommandError) as exc_info:
+        list(scratch_git_util._run_git_raw('merge-base', 'no-such-rev', 'feature'))
+
+    assert 'no-such-rev' in str(exc_info.value.stderr)
+
+
+def test_subprocess_diff_buckets(scratch_git_util):
+    """
+    Given:
+        a feature branch with a modified, an added, a deleted, a fully renamed
+        and a partially renamed file
+    When:
+        computing the raw diff against master through the git subprocess
+    Then:
+        verify each file lands in the expected bucket
+    """
+    changes = scratch_git_util._parse_raw_diff(scratch_git_util._run_git_raw(
+        'diff', '--raw', '-z', '-M', scratch_git_util._merge_base('master'), 'feature'))
+
+    assert changes['M'] == {'mod.txt'}
+    assert changes['A'] == {'added.txt'}
+    assert changes['D'] == {'del.txt'}
+    assert changes['R'] == {('ren.txt', 'ren_new.txt')}
+    assert changes['R_UNTRUE'] == {('partial.txt', 'partial_new.txt')}
+
+
+def test_pygit2_backend_parity(scratch_git_util):
+    """
+    Given:
+        a feature branch with a modified, an added, a deleted, a fully renamed
+        and a partially renamed file
+    When:
+        computing the raw diff against master with both the pygit2 backend
+        and the git subprocess fallback
+    Then:
+        verify the two backends produce identical buckets
+    """
+    pytest.importorskip('pygit2')
+    assert scratch_git_util._pygit2_repo is not None
+
+    from_pygit2 = scratch_git_util._pygit2_raw_diff('master')
+    from_subprocess = scratch_git_util._parse_raw_diff(scratch_git_util._run_git_raw(
+        'diff', '--raw', '-z', '-M', scratch_git_util._merge_base('master'), 'feature'))
+
+    assert from_pygit2 == from_subprocess